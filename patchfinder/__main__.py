@@ -48,6 +48,18 @@ def argument_parser():
         type=int,
         help="The maximum number of patches to collect."
     )
+    parser.add_argument(
+        "--concurrency",
+        dest="CONCURRENT_REQUESTS",
+        type=int,
+        help="The maximum number of concurrent requests."
+    )
+    parser.add_argument(
+        "--per-domain",
+        dest="CONCURRENT_REQUESTS_PER_DOMAIN",
+        type=int,
+        help="The maximum number of concurrent requests to a single domain."
+    )
     return parser
 
 def main():
@@ -5,13 +5,13 @@ is either to determine if a URL is a patch or to determine the xpaths to use
 for crawling a page.
 """
 
+import functools
 import logging
 import re
+from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
-_PROVIDERS = ["Github", "Gitlab", "Bitbucket", "GitKernel", "Pagure"]
-
 
 # NOTE: is a singleton pattern called for here?
 class Provider:
@@ -26,21 +26,24 @@ class Provider:
     format.
 
     Attributes:
-        link_components (list[str]): A list of components in a patch link for
-            this provider.
-        patch_components (list[str]): A list of components in a patch-formatted
+        hostname (str or None): The hostname of links belonging to this
+            provider.
+        link_components (list[re.Pattern]): A list of components in a patch
             link for this provider.
+        patch_components (list[re.Pattern]): A list of components in a
+            patch-formatted link for this provider.
         patch_format_dict (dict[str, str] or None): A dictionary for formatting
             a link into a patch link. Defaults to {r"/commit/": r"/patch/"}.
     """
 
+    hostname = None
     patch_format_dict = {r"/commit/": r"/patch/"}
 
     def __init__(
         self, link_components, patch_components, patch_format_dict=None
     ):
-        self.link_components = link_components
-        self.patch_components = patch_components
+        self.link_components = [re.compile(x) for x in link_components]
+        self.patch_components = [re.compile(x) for x in patch_components]
         if patch_format_dict:
             self.patch_format_dict = patch_format_dict
 
@@ -56,7 +59,8 @@ class Provider:
 
         Args:
             string (str): String to match patterns with.
-            patterns (list[str]): A list of regular expression patterns.
+            patterns (list[str or re.Pattern]): A list of regular expression
+                patterns.
 
         Returns:
             bool: True if string matches with all patterns, False otherwise.
@@ -73,19 +77,32 @@ class Provider:
         """bool: Checks if 'link' belongs to this provider."""
         return Provider.match_all(link, self.link_components)
 
-    @classmethod
-    def belongs(cls, link):
-        provider = cls()
-        if not provider.match_link(link):
+    def patch_link(self, link):
+        """Returns 'link' as a patch link if it belongs to this provider.
+
+        Args:
+            link (str): The link to format.
+
+        Returns:
+            (str or None): The patch-formatted link if the link belongs to this
+                provider, else None.
+        """
+        if not self.match_link(link):
             return None
-        if not provider.is_patch_link(link):
-            link = provider.patch_format(link)
+        if not self.is_patch_link(link):
+            link = self.patch_format(link)
         return link
 
+    @classmethod
+    def belongs(cls, link):
+        return cls().patch_link(link)
+
 
 class Github(Provider):
     """Subclass for GitHub as a Provider."""
 
+    hostname = "github.com"
+
     def __init__(self):
         link_components = [r"github\.com", r"/(commit|pull)/"]
         patch_components = [r"\.patch$"]
@@ -100,6 +117,8 @@ class Github(Provider):
 class Pagure(Provider):
     """Subclass for Pagure as a Provider."""
 
+    hostname = "pagure.io"
+
     def __init__(self):
         link_components = [r"pagure\.io", "/c/"]
         patch_components = [r"\.patch$"]
@@ -114,6 +133,8 @@ class Pagure(Provider):
 class Gitlab(Provider):
     """Subclass for Gitlab as a Provider."""
 
+    hostname = "gitlab.com"
+
     def __init__(self):
         link_components = [r"gitlab\.com", r"/commit/"]
         patch_components = [r"\.patch$"]
@@ -125,6 +146,8 @@ class Gitlab(Provider):
 class GitKernel(Provider):
     """Subclass for git.kernel.org as a Provider."""
 
+    hostname = "git.kernel.org"
+
     def __init__(self):
         link_components = [
             r"git\.kernel\.org",
@@ -140,6 +163,8 @@ class GitKernel(Provider):
 class Bitbucket(Provider):
     """Subclass for Bitbucket as a Provider."""
 
+    hostname = "bitbucket.org"
+
     def __init__(self):
         link_components = [r"bitbucket\.org", "/commits/"]
         patch_components = [r"/raw$"]
@@ -158,12 +183,15 @@ class Resource:
         url (str): The URL of the resource
         _links_xpaths (list[str]): A list of xpaths to use for scraping links/patches
         _normal_xpaths (list[str]): A list of xpaths to use for generic scraping
+        _normal_jmespaths (list[str]): A list of JMESPath expressions to use for
+            generic scraping of JSON
     """
 
     def __init__(self, url, **kwargs):
         self.url = url
         self._links_xpaths = kwargs.get("links_xpaths")
         self._normal_xpaths = kwargs.get("normal_xpaths")
+        self._normal_jmespaths = kwargs.get("normal_jmespaths")
 
     @staticmethod
     def get_resource(url):
@@ -253,7 +281,7 @@ class Resource:
             r"cve.json\?advisory=",
             url,
         ):
-            resource = Resource(url, normal_xpaths=["//cve/text()"])
+            resource = Resource(url, normal_jmespaths=["[].CVE"])
 
         elif re.match(
             r"^https://gitweb\.gentoo\.org/data/glsa\.git/plain/"
@@ -280,11 +308,34 @@ class Resource:
             normal_xpaths = self._normal_xpaths
         return normal_xpaths
 
+    @property
+    def normal_jmespaths(self):
+        """list[str]: Returns normal JMESPath expressions, if instance has any."""
+        normal_jmespaths = []
+        if self._normal_jmespaths:
+            normal_jmespaths = self._normal_jmespaths
+        return normal_jmespaths
+
+
+_PROVIDERS = {
+    provider.hostname: provider
+    for provider in (Github(), Gitlab(), Bitbucket(), GitKernel(), Pagure())
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def get_hostname(url):
+    """str: Returns the hostname of a URL."""
+    return urlparse(url).hostname
+
 
 # TODO: Add this to a class.
 def is_patch(link):
     """Determine if given link is a patch link.
 
+    The provider for the link is looked up by the link's hostname, so only that
+    provider's patterns are matched against the link.
+
     Args:
         link (str): The link to determine as patch or not.
 
@@ -292,17 +343,10 @@ def is_patch(link):
         (str or None): If the link is a patch link then the formatted patch link,
             else None.
     """
-    patch_link = None
-    for provider_class in _PROVIDERS:
-        provider = globals().get(provider_class)
-        if not provider:
-            logger.info(
-                "Could not find provider %s in %s, ignoring.",
-                provider_class,
-                __name__,
-            )
-            continue
-        patch_link = provider.belongs(link)
-        if patch_link:
-            break
-    return patch_link
+    link_hostname = get_hostname(link)
+    if link_hostname and link_hostname.startswith("www."):
+        link_hostname = link_hostname[len("www."):]
+    provider = _PROVIDERS.get(link_hostname)
+    if not provider:
+        return None
+    return provider.patch_link(link)
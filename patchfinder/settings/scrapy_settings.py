@@ -10,6 +10,25 @@ For meanings of individual settings, refer:
 
 USER_AGENT = "Mozilla/4.0 (compatible; MSIE 7.0; Windows NT 5.1)"
 DEPTH_LIMIT = 1
+CONCURRENT_REQUESTS = 256
+CONCURRENT_REQUESTS_PER_DOMAIN = 16
+REACTOR_THREADPOOL_MAXSIZE = 40
+SCHEDULER_PRIORITY_QUEUE = "scrapy.pqueues.DownloaderAwarePriorityQueue"
+DOWNLOAD_TIMEOUT = 15
+RETRY_ENABLED = True
+DNSCACHE_ENABLED = True
+DNSCACHE_SIZE = 500000
+DNS_RESOLVER = "scrapy.resolver.CachingHostnameResolver"
+COMPRESSION_ENABLED = True
+HTTPCACHE_ENABLED = True
+HTTPCACHE_POLICY = "scrapy.extensions.httpcache.RFC2616Policy"
+HTTPCACHE_ALWAYS_STORE = True
+HTTPCACHE_STORAGE = "scrapy.extensions.httpcache.FilesystemCacheStorage"
+HTTPCACHE_EXPIRATION_SECS = 3600
+AUTOTHROTTLE_ENABLED = True
+AUTOTHROTTLE_TARGET_CONCURRENCY = 4.0
+AUTOTHROTTLE_START_DELAY = 0.5
+AUTOTHROTTLE_MAX_DELAY = 30.0
 EXTENSIONS = {
     "scrapy.extensions.telnet.TelnetConsole": None,
     "scrapy.extensions.corestats.CoreStats": None,
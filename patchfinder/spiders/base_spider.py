@@ -3,19 +3,47 @@
 Attributes:
     logger: Module level logger.
 """
+import functools
 import json
 import logging
-import re
 
-import dicttoxml
+import jmespath
 import scrapy
+from lxml import etree
 
 from patchfinder.resource import Resource
 from patchfinder.settings import PatchfinderSettings
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _load_json(body):
+    """Decode a JSON document from bytes.
+
+    orjson is used if it is installed, since it parses bytes directly.
+
+    Args:
+        body (bytes): The JSON document.
+
+    Returns:
+        The decoded JSON document.
+    """
+    if orjson:
+        return orjson.loads(body)
+    return json.loads(body.decode())
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_xpath(xpath):
+    """lxml.etree.XPath: Returns a compiled xpath, cached for reuse."""
+    return etree.XPath(xpath, smart_strings=False)
+
+
 class BaseSpider(scrapy.Spider):
     """Base Scrapy Spider.
 
@@ -25,20 +53,30 @@ class BaseSpider(scrapy.Spider):
         name (str): Name of the spider.
         allowed_content_types (list[str]): A list of content-types, responses
             of which should be parsed.
+        content_type_callbacks (dict{bytes: str}): A dictionary of
+            content-types and names of the parse methods for responses with
+            those content-types. Responses with any other content-type are
+            parsed with parse_default.
     """
 
+    content_type_callbacks = {b"application/json": "parse_json"}
+
     def __init__(self, name, settings=None):
         if not settings:
             settings = PatchfinderSettings()
         self.allowed_content_types = settings["ALLOWED_CONTENT_TYPES"]
         self.name = name
+        self._callbacks = {
+            content_type: getattr(self, name)
+            for content_type, name in self.content_type_callbacks.items()
+        }
         super(BaseSpider, self).__init__(name)
 
     def parse(self, response):
         """Parse the given response.
 
-        The relevant parse callable for the response is determined and items are
-        generated from it.
+        The relevant parse callable for the response is determined by the
+        response's content-type and items are generated from it.
 
         Args:
             response (scrapy.Response): A response object.
@@ -47,9 +85,10 @@ class BaseSpider(scrapy.Spider):
             (str or scrapy.Item or scrapy.http.Request):
                 Items/Requests generated from the parse callable.
         """
-        parse_callable = self._callback(response)
-        if parse_callable:
-            yield from parse_callable(response)
+        parse_callable = self._callbacks.get(
+            self._content_type(response), self.parse_default
+        )
+        yield from parse_callable(response)
 
     def parse_default(self, response):
         """Default parse method.
@@ -68,8 +107,7 @@ class BaseSpider(scrapy.Spider):
     def parse_json(self, response):
         """Parse a JSON response.
 
-        The response is converted to XML and then parsed as per the necessary
-        xpath(s).
+        The response is parsed as per the necessary JMESPath expression(s).
 
         Args:
             response (scrapy.http.Response): The Response object.
@@ -78,28 +116,33 @@ class BaseSpider(scrapy.Spider):
             (str or scrapy.Item or scrapy.http.Request):
                 Items/Requests generated from the response.
         """
-        response = self._json_response_to_xml(response)
         yield from self._generate_items_and_requests(response)
 
+    def _generate_items_and_requests(self, response):
+        """str: Yields scraped items."""
+        yield from self._scrape_by_content(response)
+
     @staticmethod
-    def _json_response_to_xml(response):
-        """Convert a JSON response to XML.
+    def _content_type(response):
+        """bytes: Returns the media type of a response's Content-Type."""
+        content_type = response.headers.get("Content-Type") or b""
+        return content_type.split(b";", 1)[0].strip().lower()
+
+    def _scrape_by_content(self, response):
+        """Scrape a given response w/r/t its content-type.
 
-        This enables parsing the JSON with Xpaths.
+        JSON responses are scraped with the response's normal JMESPath
+        expressions, any other response with its normal xpaths.
 
         Args:
-            response (scrapy.http.Response): A response object.
+            response (scrapy.http.Response): A Response object.
 
         Returns:
-            scrapy.http.Response: The same response with an XML body.
+            iterator[str]: Items scraped from the response.
         """
-        dictionary = json.loads(response.body.decode())
-        xml = dicttoxml.dicttoxml(dictionary)
-        return response.replace(body=xml)
-
-    def _generate_items_and_requests(self, response):
-        """str: Yields scraped items."""
-        yield from self._scrape(response)
+        if self._content_type(response) == b"application/json":
+            return self._scrape_json(response)
+        return self._scrape(response)
 
     # TODO: Should yield Item objects rather than strings.
     @staticmethod
@@ -107,7 +150,8 @@ class BaseSpider(scrapy.Spider):
         """Scrape a given response.
 
         Items are scraped from the response w/r/t the response's normal xpaths.
-        These items are then yielded.
+        The xpaths are compiled once and evaluated on the response's parsed
+        document. These items are then yielded.
 
         Args:
             response (scrapy.http.Response): A Response object.
@@ -116,54 +160,41 @@ class BaseSpider(scrapy.Spider):
             str: Items scraped from the response.
         """
         xpaths = Resource.get_resource(response.url).normal_xpaths
+        root = response.selector.root
         for xpath in xpaths:
-            scraped_items = response.xpath(xpath).extract()
+            try:
+                scraped_items = _compile_xpath(xpath)(root)
+            except etree.XPathError:
+                scraped_items = None
+            # Anything other than strings, e.g. elements, is left to the
+            # selector to be extracted.
+            if not isinstance(scraped_items, list) or not all(
+                    isinstance(item, str) for item in scraped_items
+            ):
+                scraped_items = response.xpath(xpath).extract()
             for item in scraped_items:
                 yield item
 
-    def _callback(self, response):
-        """Returns the callback method for a response.
-
-        The callback method is used to parse the response. It can be based on
-        the content-type of the response or on the response URL itself, since
-        certain URLs can warrant using a different parse method altogether.
-
-        Args:
-            response (scrapy.http.Response): The response for which the
-                callable is to be determined.
-
-        Returns:
-            callable: A parse callable.
-        """
-        callback = self._callback_by_url(response)
-        if not callback:
-            callback = self._callback_by_content(response)
-        return callback
-
-    def _callback_by_url(self, response):
-        """Returns the parse callable based on the response URL.
-
-        Args:
-            response (scrapy.http.Response): The response for which the
-                callable is to be determined.
-
-        Returns:
-            callable: A parse callable.
-        """
-        return None
+    @staticmethod
+    def _scrape_json(response):
+        """Scrape a given JSON response.
 
-    def _callback_by_content(self, response):
-        """Returns the parse callable based on the response's content-type.
+        Items are scraped from the decoded response body w/r/t the response's
+        normal JMESPath expressions. These items are then yielded.
 
         Args:
             response (scrapy.http.Response): A Response object.
 
-        Returns:
-            callable: A parse callable.
+        Yields:
+            str: Items scraped from the response.
         """
-        content_type = response.headers.get("Content-Type").decode()
-        if re.search(r"application/json", content_type):
-            callback = self.parse_json
-        else:
-            callback = self.parse_default
-        return callback
+        data = _load_json(response.body)
+        jmespaths = Resource.get_resource(response.url).normal_jmespaths
+        for expression in jmespaths:
+            scraped_items = jmespath.search(expression, data)
+            if scraped_items is None:
+                continue
+            if not isinstance(scraped_items, list):
+                scraped_items = [scraped_items]
+            for item in scraped_items:
+                yield item
@@ -6,14 +6,13 @@ Attributes:
     logger: Module level logger.
 """
 import logging
-from urllib.parse import urlparse
 
 from scrapy.http import Request
 from scrapy.linkextractors.lxmlhtml import LxmlLinkExtractor
 
 import patchfinder.context as context
 import patchfinder.spiders.items as items
-from patchfinder.resource import Resource, is_patch
+from patchfinder.resource import Resource, get_hostname, is_patch
 from patchfinder.settings import PatchfinderSettings
 from .base_spider import BaseSpider
 
@@ -32,29 +31,30 @@ class DefaultSpider(BaseSpider):
 
     Attributes:
         vuln (Vulnerability): The vulnerability for which patches are to be found.
-        patches (list[str]): A list of patch links the spider has found.
-        deny_domains (list[str]): A list of domains to deny crawling links of.
-        important_domains (list[str]): A list of domains with higher crawling
-            priority.
+        patches (set[str]): A set of patch links the spider has found.
+        deny_domains (frozenset[str]): A set of domains to deny crawling links
+            of.
+        important_domains (frozenset[str]): A set of domains with higher
+            crawling priority.
         patch_limit (int): A threshold for the number of patches to collect.
-        allowed_keys (set[str]): A set of allowed keys for initialization.
         debian (bool): Boolean value to call the Debian parser.
     """
 
     def __init__(self, **kwargs):
-        self.patches = []
+        self.patches = set()
         if "vuln" in kwargs:
             self.set_context(kwargs.get("vuln"))
         settings = kwargs.get("settings", None)
         if not settings:
             settings = PatchfinderSettings()
         self.deny_pages = settings["DENY_PAGES"]
-        self.deny_domains = settings["DENY_DOMAINS"]
-        self.important_domains = settings["IMPORTANT_DOMAINS"]
+        self.deny_domains = frozenset(settings["DENY_DOMAINS"])
+        self.important_domains = frozenset(settings["IMPORTANT_DOMAINS"])
         self.patch_limit = settings["PATCH_LIMIT"]
         self.debian = settings["PARSE_DEBIAN"]
         self.patch_find_meta = settings["PATCH_FIND_META"]
         self._processed_vulns = set()
+        self._extractor_cache = {}
         self.vuln_request_meta = self.patch_find_meta.copy()
         self.vuln_request_meta["reset_depth"] = True
         super(DefaultSpider, self).__init__("default_spider", settings=settings)
@@ -149,16 +149,17 @@ class DefaultSpider(BaseSpider):
         if response.meta.get("find_patches"):
             yield from self._patches_and_requests(response)
         else:
-            yield from self._scrape(response)
+            yield from self._scrape_by_content(response)
 
     def _patches_and_requests(self, response):
         """Extract patch links and links to crawl from a response.
 
-        The links from the response body are extracted first.
-        The patch links are added to the retrieved patches list.
-        Corresponding items and requests are generated from these links.
-        If the number of patches found is equal to the patch_limit,
-        no more requests or items are generated.
+        The links from the response body are extracted first and divided as
+        they are iterated over. The patch links are added to the retrieved
+        patches set and items for them are generated right away. Requests are
+        generated for the remaining links afterwards. Once the number of
+        patches found reaches the patch_limit, no more requests or items are
+        generated and the remaining links are not divided.
 
         Args:
             response (scrapy.http.Response): The Response object sent by Scrapy.
@@ -167,22 +168,31 @@ class DefaultSpider(BaseSpider):
             (scrapy.Item or scrapy.http.Request):
                 Items/Requests scraped from the response.
         """
-        links = self._extract_links(response)
-        for link in links["patch_links"]:
-            if len(self.patches) < self.patch_limit:
-                if link not in self.patches:
-                    self._add_patch(link)
-                    patch = self._create_patch_item(link, response.url)
-                    yield patch
-        for link in links["links"]:
-            if len(self.patches) < self.patch_limit:
-                priority = self._domain_priority(link)
-                yield Request(
-                    link,
-                    meta=self.patch_find_meta,
-                    callback=self.parse,
-                    priority=priority,
-                )
+        patches = self.patches
+        patch_limit = self.patch_limit
+        if len(patches) >= patch_limit:
+            return
+        links = []
+        for link, patch_link in self._extract_links(response):
+            if not patch_link:
+                links.append(link)
+                continue
+            if patch_link not in patches:
+                self._add_patch(patch_link)
+                patch = self._create_patch_item(patch_link, response.url)
+                yield patch
+            if len(patches) >= patch_limit:
+                return
+        for link in links:
+            if len(patches) >= patch_limit:
+                break
+            priority = self._domain_priority(link)
+            yield Request(
+                link,
+                meta=self.patch_find_meta,
+                callback=self.parse,
+                priority=priority,
+            )
 
     # TODO: Handle www. case here. In fact, create a method to return
     #      domain name such that all corner cases are handled.
@@ -199,7 +209,7 @@ class DefaultSpider(BaseSpider):
         Returns:
             int: 1 if the url belongs to an important domain, 0 otherwise.
         """
-        domain = urlparse(url).hostname
+        domain = get_hostname(url)
         if domain in self.important_domains:
             return 1
         return 0
@@ -221,42 +231,57 @@ class DefaultSpider(BaseSpider):
                 non-patch links.
 
         Returns:
-            (dict{str: list[str]} or list[str]):
-                If divide is True, a dictionary of patch and non-patch links,
-                else a list of links.
+            (iterator[tuple[str, str or None]] or list[str]):
+                If divide is True, an iterator of links paired with their
+                patch links, else a list of links.
         """
         xpaths = Resource.get_resource(response.url).links_xpaths
-        links = LxmlLinkExtractor(
-            deny=self.deny_pages,
-            deny_domains=self.deny_domains,
-            restrict_xpaths=xpaths,
-        ).extract_links(response)
+        links = self._link_extractor(xpaths).extract_links(response)
         if divide:
-            return self._divide_links(response, links)
+            return self._divide_links(links)
         return [link.url for link in links]
 
+    def _link_extractor(self, xpaths):
+        """Returns a link extractor for the given xpaths.
+
+        Link extractors are cached w/r/t the xpaths and the spider's deny
+        filters, since building one compiles its filters every time.
+
+        Args:
+            xpaths (list[str]): A list of xpaths to restrict link extraction to.
+
+        Returns:
+            scrapy.linkextractors.lxmlhtml.LxmlLinkExtractor: A link extractor.
+        """
+        key = (tuple(xpaths), tuple(self.deny_pages), self.deny_domains)
+        extractor = self._extractor_cache.get(key)
+        if extractor is None:
+            extractor = LxmlLinkExtractor(
+                deny=self.deny_pages,
+                deny_domains=self.deny_domains,
+                restrict_xpaths=xpaths,
+            )
+            self._extractor_cache[key] = extractor
+        return extractor
+
     @staticmethod
-    def _divide_links(response, links):
+    def _divide_links(links):
         """Divide links into patch links and non patch links
 
+        The links are divided lazily, so that a caller can stop consuming them
+        without the rest of the links being checked. The link extractor
+        already resolves links against the response's URL, so the links'
+        URLs are used as they are.
+
         Args:
-            response (scrapy.http.Response): The response from which the links
-                are extracted
             links (list[scrapy.link.Link]): The list of links extracted
 
-        Returns:
-            dict{str: list[str]}:
-                A dictionary of links divided into patch and non-patch links
+        Yields:
+            tuple[str, str or None]: A link and its formatted patch link if the
+                link is a patch link, else None.
         """
-        divided_links = {"patch_links": [], "links": []}
         for link in links:
-            link = response.urljoin(link.url[0:])
-            patch_link = is_patch(link)
-            if patch_link:
-                divided_links["patch_links"].append(patch_link)
-            else:
-                divided_links["links"].append(link)
-        return divided_links
+            yield link.url, is_patch(link.url)
 
     @staticmethod
     def _create_patch_item(patch_link, reaching_path):
@@ -266,4 +291,4 @@ class DefaultSpider(BaseSpider):
         return patch
 
     def _add_patch(self, patch_link):
-        self.patches.append(patch_link)
+        self.patches.add(patch_link)
@@ -34,9 +34,9 @@ setup(
     ],
     python_requires=">=3.5",
     install_requires=[
-        "dicttoxml==1.7.4",
         "PyGithub==1.43",
         "Scrapy",
         "attrs>=17.4",
+        "jmespath",
     ],
 )
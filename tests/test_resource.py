@@ -37,6 +37,26 @@ class TestResource(unittest.TestCase):
         patch_link = resource.is_patch(link)
         self.assertEqual(patch_link, link + "/raw")
 
+    def test_gitkernel_is_patch(self):
+        link = (
+            "https://git.kernel.org/pub/scm/linux/kernel/git/torvalds/linux.git"
+            "/commit/?id=7e2f3a4f4b6437e3f8b1d0e0ab3e7ebe1b4a47d1"
+        )
+        patch_link = resource.is_patch(link)
+        self.assertEqual(patch_link, link.replace("/commit/", "/patch/"))
+
+    def test_www_github_is_patch(self):
+        link = (
+            "https://www.github.com/uclouvain/openjpeg/commit/162f6199c"
+            "0cd3ec1c6c6dc65e41b2faab92b2d91"
+        )
+        patch_link = resource.is_patch(link)
+        self.assertEqual(patch_link, link + ".patch")
+
+    def test_unknown_provider_is_not_patch(self):
+        link = "https://example.com/uclouvain/openjpeg/commit/162f6199c"
+        self.assertIsNone(resource.is_patch(link))
+
     def test_mitre_url_mapping(self):
         url = "https://cve.mitre.org/cgi-bin/cvename.cgi?name=CVE-2016-4796"
         resource = Resource.get_resource(url)
@@ -1,10 +1,12 @@
 import unittest
+import unittest.mock as mock
 
 from scrapy.http import Request
 
 import patchfinder.context as context
 import patchfinder.spiders.default_spider as default_spider
 import patchfinder.spiders.items as items
+from patchfinder.resource import Resource
 from patchfinder.settings import PatchfinderSettings
 from tests import fake_response
 
@@ -185,6 +187,35 @@ class TestSpider(unittest.TestCase):
         requests_and_items = list(self.spider.parse(response))
         self.assertEqual(len(requests_and_items), 2)
 
+    def test_parse_response_with_patch_limit_reached(self):
+        """Spider should yield nothing once the patch limit is reached.
+
+        Tests:
+            patchfinder.spiders.base_spider.BaseSpider.parse
+        """
+        response = fake_response(
+            file_name="./mocks/3.html",
+            url="https://lists.fedoraproject.org/archives/list/package-a"
+            "nnounce@lists.fedoraproject.org/message/5FFMOZOF2EI6N"
+            "2CR23EQ5EATWLQKBMHW/",
+            meta=self.settings["PATCH_FIND_META"],
+            content_type=b"text/html",
+        )
+        self.spider.patch_limit = 1
+        self.spider.patches.add("https://github.com/foo/bar/commit/baz.patch")
+        requests_and_items = list(self.spider.parse(response))
+        self.assertFalse(requests_and_items)
+
+    def test_link_extractor_is_reused(self):
+        """Link extractors should be built once per set of xpaths.
+
+        Tests:
+            patchfinder.spiders.default_spider.DefaultSpider._link_extractor
+        """
+        extractor = self.spider._link_extractor(["//pre/a"])
+        self.assertIs(self.spider._link_extractor(["//pre/a"]), extractor)
+        self.assertIsNot(self.spider._link_extractor(["//body//a"]), extractor)
+
     def test_parse_json_response_with_redhat_secapi_url(self):
         """Parse a JSON response.
 
@@ -201,6 +232,62 @@ class TestSpider(unittest.TestCase):
         requests_and_items = set(self.spider.parse(response))
         self.assertEqual(requests_and_items, expected_items)
 
+    def test_parse_json_response_with_content_type_parameters(self):
+        """Parameters in the content-type should not affect parsing.
+
+        Tests:
+            patchfinder.spiders.base_spider.BaseSpider.parse
+        """
+        response = fake_response(
+            file_name="./mocks/mock_json.json",
+            url="https://access.redhat.com/labs/securitydataapi/cve.json?"
+            "advisory=foobar",
+            content_type=b"application/json; charset=utf-8",
+        )
+        expected_items = {"CVE-2015-5370", "CVE-2016-2110"}
+        requests_and_items = set(self.spider.parse(response))
+        self.assertEqual(requests_and_items, expected_items)
+
+    def test_parse_json_response_to_find_patches(self):
+        """A JSON response with find_patches meta should not yield scraped data.
+
+        Only patch items and requests should be generated when finding
+        patches, so the strings scraped from the JSON should not be yielded.
+
+        Tests:
+            patchfinder.spiders.base_spider.BaseSpider.parse_json
+        """
+        response = fake_response(
+            file_name="./mocks/mock_json.json",
+            url="https://access.redhat.com/labs/securitydataapi/cve.json?"
+            "advisory=foobar",
+            meta=self.settings["PATCH_FIND_META"],
+            content_type=b"application/json",
+        )
+        requests_and_items = list(self.spider.parse(response))
+        for item in requests_and_items:
+            self.assertIsInstance(item, (items.Patch, Request))
+
+    def test_parse_json_response_with_scalar_jmespath_result(self):
+        """A JMESPath expression giving a single value should yield it whole.
+
+        Tests:
+            patchfinder.spiders.base_spider.BaseSpider._scrape_json
+        """
+        url = (
+            "https://access.redhat.com/labs/securitydataapi/cve.json?"
+            "advisory=foobar"
+        )
+        response = fake_response(
+            file_name="./mocks/mock_json.json",
+            url=url,
+            content_type=b"application/json",
+        )
+        resource = Resource(url, normal_jmespaths=["[0].CVE", "[0].foo"])
+        with mock.patch.object(Resource, "get_resource", return_value=resource):
+            requests_and_items = list(self.spider.parse(response))
+        self.assertEqual(requests_and_items, ["CVE-2015-5370"])
+
     def test_determine_aliases_with_no_generic_vulns(self):
         """The aliases of a vulnerability should be scraped from the response.
 